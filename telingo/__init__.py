@@ -18,7 +18,29 @@ import clingo as _clingo
 import clingo.ast as _ast
 import textwrap as _textwrap
 
-def imain(prg, future_sigs, program_parts, on_model, imin = 0, imax = None, istop = "SAT"):
+# root program names encoded as integers for the checks in the solving loop
+_root_always  = 0
+_root_dynamic = 1
+_root_initial = 2
+_root_tags    = {"always": _root_always, "dynamic": _root_dynamic, "initial": _root_initial}
+
+class _OnModel:
+    """
+    Callable adapter passing the current step to a model callback.
+
+    Avoids allocating a fresh closure for every solve call in imain; only the
+    step attribute is updated between calls.
+    """
+    __slots__ = ("fn", "step")
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.step = 0
+
+    def __call__(self, model):
+        return self.fn(model, self.step)
+
+def imain(prg, future_sigs, program_parts, on_model, imin = 0, imax = None, istop = "SAT", cleanup_every = 4):
     """
     Take a program object and runs the incremental main solving loop.
 
@@ -44,33 +66,61 @@ def imain(prg, future_sigs, program_parts, on_model, imin = 0, imax = None, isto
     imin          -- Minimum number of iterations.
     imax          -- Maximum number of iterations.
     istop         -- When to stop.
+    cleanup_every -- Simplify the program database only every this many steps
+                     since cleaning up walks the whole database; zero disables
+                     the cleanup. Released externals accumulate between
+                     cleanups in exchange for cheaper iterations.
     """
     f = _ty.Theory()
     step, ret = 0, None
+    plan = [(part_name, i, _root_tags.get(root_name, -1))
+            for root_name, part_name, rng in program_parts
+            for i in rng]
+    seen_future = set()
+    future_literals = {}
+    grounded = set()
+    cb = _OnModel(on_model)
     while ((imax is None or step < imax) and
            (step == 0 or step < imin or (
               (istop == "SAT"     and not ret.satisfiable) or
               (istop == "UNSAT"   and not ret.unsatisfiable) or
               (istop == "UNKNOWN" and not ret.unknown)))):
         parts = []
-        for root_name, part_name, rng in program_parts:
-            for i in rng:
-                if ((step - i >= 0 and root_name == "always") or
-                    (step - i  > 0 and root_name == "dynamic") or
-                    (step - i == 0 and root_name == "initial")):
+        for part_name, i, tag in plan:
+            if ((step - i >= 0 and tag == _root_always) or
+                (step - i  > 0 and tag == _root_dynamic) or
+                (step - i == 0 and tag == _root_initial)):
+                # skip instantiations that have already been grounded, e.g.,
+                # because of overlapping ranges in program_parts
+                key = (part_name, step - i, step)
+                if key not in grounded:
+                    grounded.add(key)
                     parts.append((part_name, [_clingo.Number(step - i), _clingo.Number(step)]))
         if step > 0:
-            prg.release_external(_clingo.Function("__final", [_clingo.Number(step-1)]))
-            prg.cleanup()
+            prg.release_external(final)
+            if cleanup_every > 0 and step % cleanup_every == 0:
+                prg.cleanup()
         prg.ground(parts)
         f.translate(step, prg)
-        prg.assign_external(_clingo.Function("__final", [_clingo.Number(step)]), True)
-        assumptions = []
+        final = _clingo.Function("__final", [_clingo.Number(step)])
+        prg.assign_external(final, True)
+        # literals of future atoms are collected once per atom and grouped by
+        # time point so that only atoms added by the last ground call have to
+        # be inspected
         for name, arity, positive in future_sigs:
             for atom in prg.symbolic_atoms.by_signature(name, arity, positive):
-                if atom.symbol.arguments[-1].number > step:
-                    assumptions.append(-atom.literal)
-        ret, step = prg.solve(on_model=lambda m: on_model(m, step), assumptions=assumptions), step+1
+                lit = atom.literal
+                if lit in seen_future:
+                    continue
+                seen_future.add(lit)
+                t = atom.symbol.arguments[-1].number
+                if t > step:
+                    future_literals.setdefault(t, []).append(lit)
+        for t in [t for t in future_literals if t <= step]:
+            del future_literals[t]
+        assumptions = [-lit for lits in future_literals.values() for lit in lits]
+        cb.step = step
+        ret, step = prg.solve(on_model=cb, assumptions=assumptions), step+1
 
 class Application:
     """
@@ -129,15 +179,19 @@ class Application:
         return self.__istop in ["SAT", "UNSAT", "UNKNOWN"]
 
     def print_model(self, model, printer):
-        table = {}
-        for sym in model.symbols(shown=True):
-            if sym.type == _clingo.SymbolType.Function and len(sym.arguments) > 0:
-                table.setdefault(sym.arguments[-1].number, []).append(_clingo.Function(sym.name, sym.arguments[:-1], sym.positive))
+        symbols = [(sym.arguments[-1].number, _clingo.Function(sym.name, sym.arguments[:-1], sym.positive))
+                   for sym in model.symbols(shown=True)
+                   if sym.type == _clingo.SymbolType.Function and len(sym.arguments) > 0]
+        symbols.sort()
+        idx = 0
         for step in range(self.__horizon+1):
-            symbols = table.get(step, [])
             _sys.stdout.write(" State {}:".format(step))
             sig = None
-            for sym in sorted(symbols):
+            while idx < len(symbols) and symbols[idx][0] < step:
+                idx += 1
+            while idx < len(symbols) and symbols[idx][0] == step:
+                sym = symbols[idx][1]
+                idx += 1
                 if not sym.name.startswith('__'):
                     if (sym.name, len(sym.arguments), sym.positive) != sig:
                         _sys.stdout.write("\n ")
@@ -164,11 +218,18 @@ class Application:
         This function implements the Application.main() function as required by
         clingo.clingo_main().
         """
-        with _ast.ProgramBuilder(prg) as b:
-            files = [open(f) for f in files]
+        def inputs():
+            """
+            Yields the contents of the given files one at a time.
+            """
             if len(files) == 0:
-                files.append(_sys.stdin)
-            future_sigs, program_parts = _tf.transform([f.read() for f in files], b.add)
+                yield _sys.stdin.read()
+            for name in files:
+                with open(name) as f:
+                    yield f.read()
+
+        with _ast.ProgramBuilder(prg) as b:
+            future_sigs, program_parts = _tf.transform(inputs(), b.add)
 
         imain(prg, future_sigs, program_parts, self.__on_model, self.__imin, self.__imax, self.__istop)
 
@@ -157,6 +157,7 @@ class ShiftFormula(_tf.TelTransformer):
     Shifts the given formula.
     """
     def __init__(self, shift):
+        super().__init__()
         self.__shift = shift
 
     def visit_TelAtom(self, x):
@@ -206,6 +207,7 @@ def unfold_formula(x):
 
 class HeadFormulaToBodyFormula(_tf.TelTransformer):
     def __init__(self, add_formula):
+        super().__init__()
         self.__add_formula = add_formula
 
     def visit_TelAtom(self, x):
@@ -235,6 +237,7 @@ def head_formula_to_body_formula(x, add_formula):
 
 class ClauseToRule(_tf.TelTransformer):
     def __init__(self, head, body):
+        super().__init__()
         self.__head = head
         self.__body = body
 
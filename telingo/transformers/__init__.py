@@ -75,7 +75,7 @@ from textwrap import dedent as _dedent
 
 def transform(inputs, callback):
     """
-    Transforms the given list of temporal programs in string form into an ASP
+    Transforms the given temporal programs in string form into an ASP
     program.
 
     Returns the future predicates whose atoms have to be set to false if
@@ -83,7 +83,7 @@ def transform(inputs, callback):
     there are constraints referring to the future.
 
     Arguments:
-    inputs   -- The list of inputs.
+    inputs   -- Iterable of inputs, which are parsed one at a time.
     callback -- Callback for rewritten statements.
     """
     loc = _ast.Location(_ast.Position('<transform>', 1, 1), _ast.Position('<transform>', 1, 1))
@@ -109,15 +109,22 @@ def transform(inputs, callback):
     future_sigs = []
     if len(future_predicates) > 0:
         callback(_ast.Program(loc, "always", [_ast.Id(loc, _tf.g_time_parameter_name), _ast.Id(loc, _tf.g_time_parameter_name_alt)]))
-        for name, arity, positive, shift in sorted(future_predicates):
-            variables = [ _ast.Variable(loc, "{}{}".format(_tf.g_variable_prefix, i)) for i in range(arity) ]
+        add_sign = lambda lit, positive: lit if positive else _ast.UnaryOperation(loc, _ast.UnaryOperator.Minus, lit)
+        # auxiliary variables are shared between rules and only extended on demand
+        variables = []
+        # materialized and sorted once so rules are emitted in a deterministic
+        # order independent of how the set was populated
+        predicates = sorted(future_predicates)
+        for name, arity, positive, shift in predicates:
+            while len(variables) < arity:
+                variables.append(_ast.Variable(loc, "{}{}".format(_tf.g_variable_prefix, len(variables))))
+            args = variables[:arity]
             s = _ast.SymbolicTerm(loc, _clingo.Number(shift))
-            t_shifted = _ast.BinaryOperation(loc, _ast.BinaryOperator.Plus, time, s)
-            add_sign = lambda lit: lit if positive else _ast.UnaryOperation(loc, _ast.UnaryOperator.Minus, lit)
-            p_current = _ast.SymbolicAtom(add_sign(_ast.Function(loc, name, variables + [time], False)))
-            f_current =  _ast.SymbolicAtom(add_sign(_ast.Function(loc, _tf.g_future_prefix + name, variables + [s, time], False)))
+            future = _tf.g_future_prefix + name
+            p_current = _ast.SymbolicAtom(add_sign(_ast.Function(loc, name, args + [time], False), positive))
+            f_current = _ast.SymbolicAtom(add_sign(_ast.Function(loc, future, args + [s, time], False), positive))
             callback(_ast.Rule(loc, wrap_lit(p_current), [wrap_lit(f_current)]))
-            future_sigs.append((_tf.g_future_prefix + name, arity + 2, positive))
+            future_sigs.append((future, arity + 2, positive))
 
     # gather rules for constraints referring to the future
     reground_parts = []
@@ -12,6 +12,15 @@ from . import head as _th
 import clingo as _clingo
 from clingo import ast as _ast
 
+# AST types of statements that have a body the __final atom can be added to
+_BODY_TYPES = frozenset([_ast.ASTType.Rule,
+                         _ast.ASTType.ShowTerm,
+                         _ast.ASTType.Minimize,
+                         _ast.ASTType.External,
+                         _ast.ASTType.Edge,
+                         _ast.ASTType.Heuristic,
+                         _ast.ASTType.ProjectAtom])
+
 class ProgramTransformer(_ast.Transformer):
     """
     Rewrites all temporal operators in a logic program.
@@ -38,6 +47,10 @@ class ProgramTransformer(_ast.Transformer):
     __aux_rules        -- Auxiliary always quantified rules added during
                           translation.
     """
+    __slots__ = ("__final", "__head", "__constraint", "__negation", "__normal",
+                 "__max_shift", "__term_transformer", "__head_transformer",
+                 "__constraint_parts", "__aux_rules", "__part")
+
     def __init__(self, future_predicates, constraint_parts, aux_rules):
         self.__final = False
         self.__head = False
@@ -63,7 +76,7 @@ class ProgramTransformer(_ast.Transformer):
         The extension happens before the node is visited normally so the time
         parameter is added to the atom accordingly.
         """
-        if self.__final and isinstance(x, _ast.AST) and hasattr(x, "body"):
+        if self.__final and isinstance(x, _ast.AST) and x.ast_type in _BODY_TYPES:
             self.__append_final(x)
         if isinstance(x, _ast.ASTSequence):
             return _ast.Transformer.visit_sequence(self, x, *args, **kwargs)
@@ -85,7 +98,9 @@ class ProgramTransformer(_ast.Transformer):
             self.__head = False
             rule.body = self.visit(rule.body)
             if self.__max_shift[0] > 0 and not self.__final:
-                last = _ast.Rule(rule.location, rule.head, rule.body[:])
+                # the constructor copies the body, so appending the __final
+                # atom to the original rule below does not affect the copy
+                last = _ast.Rule(rule.location, rule.head, rule.body)
                 self.__append_final(rule, _clingo.Function(_tf.g_time_parameter_name_alt))
                 self.__constraint_parts.setdefault((self.__part, self.__max_shift[0]), []).append((rule, last))
                 return None
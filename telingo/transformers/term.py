@@ -25,6 +25,8 @@ class TermTransformer(_ast.Transformer):
                          operators and positive whether the literal is
                          positive.
     """
+    __slots__ = ("__future_predicates", "__positive", "__time")
+
     def __init__(self, future_predicates):
         """
         Parameters:
@@ -32,6 +34,7 @@ class TermTransformer(_ast.Transformer):
         """
         self.__future_predicates = future_predicates
         self.__positive = True
+        self.__time = _clingo.Function(_tf.g_time_parameter_name)
 
     def __get_param(self, name, arity, location, replace_future, fail_future, fail_past, max_shift):
         """
@@ -75,14 +78,14 @@ class TermTransformer(_ast.Transformer):
 
         and future_predicates is extended with (p,1,2) -> False
         """
-        n = name.strip("'")
-        shift = 0
-        for c in name:
-            if c == "'":
-                shift -= 1
-            else:
-                break
-        shift += len(name) - len(n) + shift
+        lead = 0
+        while lead < len(name) and name[lead] == "'":
+            lead += 1
+        trail = 0
+        while trail < len(name) - lead and name[len(name) - 1 - trail] == "'":
+            trail += 1
+        n = name[lead:len(name) - trail]
+        shift = trail - lead
 
         initially = False
         if n.startswith("_") and not n.startswith("__"):
@@ -101,7 +104,7 @@ class TermTransformer(_ast.Transformer):
 
         if initially and finally_:
             raise RuntimeError("finally and initially operator cannot used together: {}".format(_tf.str_location(location)))
-        params = [_ast.SymbolicTerm(location, _clingo.Function(_tf.g_time_parameter_name))]
+        params = [_ast.SymbolicTerm(location, self.__time)]
         if fail_future and (shift > 0 or finally_):
             raise RuntimeError("future atoms not supported in this context: {}".format(_tf.str_location(location)))
         if fail_past and (shift < 0 or initially):
@@ -134,10 +137,20 @@ class TermTransformer(_ast.Transformer):
         """
         Transforms the given term.
 
-        See __get_param for more information.
+        Most atoms do not use temporal operators at all; such terms just get
+        the time parameter appended. See __get_param for the general case.
         """
-        term.name, params = self.__get_param(term.name, len(term.arguments), term.location, *args, **kwargs)
-        term.arguments.extend(params)
+        name = term.name
+        if ("'" not in name and
+                (not name.startswith("_") or name.startswith("__")) and
+                (not name.endswith("_") or name.endswith("__"))):
+            term.arguments.append(_ast.SymbolicTerm(term.location, self.__time))
+            return term
+        if not term.arguments:
+            term.name, term.arguments = self.__get_param(name, 0, term.location, *args, **kwargs)
+        else:
+            term.name, params = self.__get_param(name, len(term.arguments), term.location, *args, **kwargs)
+            term.arguments.extend(params)
         return term
 
     def visit_SymbolicTerm(self, term, *args, **kwargs):
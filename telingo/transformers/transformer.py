@@ -78,6 +78,33 @@ def is_disjunction(s):
     """
     return (s.ast_type == _ast.ASTType.Rule and s.head.ast_type == _ast.ASTType.Disjunction)
 
+def _compile_visit(handlers):
+    """
+    Generates a visit method with an inlined dispatch chain for the given
+    handler table.
+
+    The node types a transformer handles are fixed once its class is created,
+    so the generic table lookup can be compiled into a chain of direct
+    compares and calls.
+    """
+    lines = ["def visit(self, x, *args, **kwargs):",
+             "    if x is None:",
+             "        return x",
+             "    if type(x) is list:",
+             "        return [self.visit(y, *args, **kwargs) for y in x]",
+             "    ast_type = getattr(x, 'ast_type', None)"]
+    for name in handlers:
+        lines.append("    if ast_type == {!r}:".format(name))
+        lines.append("        return self.visit_{}(x, *args, **kwargs)".format(name))
+    lines.append("    if ast_type is None:")
+    lines.append("        raise TypeError('unexpected type')")
+    lines.append("    return self.visit_children(x, *args, **kwargs)")
+    namespace = {}
+    exec(compile("\n".join(lines), "<telingo dispatch>", "exec"), namespace)
+    fun = namespace["visit"]
+    fun._generated = True
+    return fun
+
 class TelTransformer:
     """
     Basic visitor to traverse and modify an AST.
@@ -91,18 +118,76 @@ class TelTransformer:
     the users responsibility to visit children of nodes that have node-specific
     visitor.
     """
+    __slots__ = ()
+
+    _handlers = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Builds the dispatch table mapping node types to visit_TYPE methods.
+
+        The table is created once per subclass and shared by all its
+        instances; methods defined in base classes are inherited.
+        """
+        super().__init_subclass__(**kwargs)
+        handlers = {}
+        for klass in reversed(cls.__mro__):
+            for name, fun in vars(klass).items():
+                if name.startswith("visit_") and name != "visit_children":
+                    handlers[name[6:]] = fun
+        cls._handlers = handlers
+        visit = getattr(cls, "visit", None)
+        if visit is TelTransformer.visit or getattr(visit, "_generated", False):
+            cls.visit = _compile_visit(handlers)
+
     def visit_children(self, x, *args, **kwargs):
         """
         Visits and transforms the children of the given node.
+
+        The traversal is driven by an explicit work stack so that chains of
+        nodes without node-specific visitors are rebuilt without one Python
+        call frame per child. Node-specific visitors are still invoked as
+        regular calls and may recurse via visit.
         """
-        updated = []
-        for key in x.keys:
-            if key in x.child_keys:
-                value = self.visit(getattr(x, key), *args, **kwargs)
-                updated.append(value)
+        vals = []
+        ops = [("node", x)]
+        while ops:
+            op, arg = ops.pop()
+            if op == "visit":
+                if arg is None:
+                    vals.append(arg)
+                elif type(arg) is list:
+                    ops.append(("list", len(arg)))
+                    for y in reversed(arg):
+                        ops.append(("visit", y))
+                else:
+                    ast_type = getattr(arg, "ast_type", None)
+                    if ast_type is None:
+                        raise TypeError("unexpected type")
+                    fun = self._handlers.get(ast_type)
+                    if fun is None:
+                        ops.append(("node", arg))
+                    else:
+                        vals.append(fun(self, arg, *args, **kwargs))
+            elif op == "node":
+                ops.append(("build", arg))
+                for key in reversed(arg.keys):
+                    if key in arg.child_keys:
+                        ops.append(("visit", getattr(arg, key)))
+                    else:
+                        ops.append(("value", getattr(arg, key)))
+            elif op == "build":
+                n = len(arg.keys)
+                children = vals[len(vals) - n:]
+                del vals[len(vals) - n:]
+                vals.append(arg.__class__(*children))
+            elif op == "list":
+                lst = vals[len(vals) - arg:]
+                del vals[len(vals) - arg:]
+                vals.append(lst)
             else:
-                updated.append(getattr(x, key))
-        return x.__class__(*updated)
+                vals.append(arg)
+        return vals[0]
 
     def visit(self, x, *args, **kwargs):
         """
@@ -115,19 +200,22 @@ class TelTransformer:
         This function accepts additional positional and keyword arguments,
         which are passed to node-specific visit functions and to the visit
         function called for child nodes.
+
+        Dispatch goes through the class-level handler table built in
+        __init_subclass__, avoiding any per-node string concatenation and
+        attribute lookup.
         """
-        if hasattr(x, "ast_type"):
-            attr = "visit_" + str(x.ast_type)
-            if hasattr(self, attr):
-                return getattr(self, attr)(x, *args, **kwargs)
-            else:
-                return self.visit_children(x, *args, **kwargs)
-        elif isinstance(x, list):
-            return [self.visit(y, *args, **kwargs) for y in x]
-        elif x is None:
+        if x is None:
             return x
-        else:
+        if type(x) is list:
+            return [self.visit(y, *args, **kwargs) for y in x]
+        ast_type = getattr(x, "ast_type", None)
+        if ast_type is None:
             raise TypeError("unexpected type")
+        fun = self._handlers.get(ast_type)
+        if fun is None:
+            return self.visit_children(x, *args, **kwargs)
+        return fun(self, x, *args, **kwargs)
 
     def __call__(self, x, *args, **kwargs):
         """